@@ -1,20 +1,390 @@
-import requests
+import asyncio
+import functools
+import httpx
+import ijson
+import orjson
 import os
-import json
+import tempfile
 import time
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Any, Tuple, Union
 from datetime import datetime
 import logging
-from urllib.parse import urlparse, urljoin
+import operator
 import re
+import stat
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow es opcional, solo se necesita con as_table=True
+    pa = None
+
+try:
+    import hishel
+    from hishel.httpx import AsyncCacheTransport
+except ImportError:  # caché HTTP opcional: hishel[async]>=1.0 (requiere Python >=3.10)
+    hishel = None
+
+
+@dataclass(frozen=True)
+class RepoRef:
+    """Referencia inmutable a un repositorio ya parseado"""
+    __slots__ = ('platform', 'provider', 'owner', 'repo', 'base_url')
+    
+    platform: str
+    provider: str  # 'github.com', 'gitlab.com' o el host si no está soportado
+    owner: str
+    repo: str
+    base_url: str
+    
+    # Con __slots__ y frozen, pickle y copy no pueden restaurar los campos con
+    # setattr; se hace como dataclass(slots=True) en Python >=3.10
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+@dataclass
+class Repository:
+    """Información básica de un repositorio"""
+    __slots__ = (
+        'name', 'full_name', 'description', 'language', 'stars', 'forks',
+        'watchers', 'issues', 'created_at', 'updated_at', 'size',
+        'default_branch', 'topics', 'license', 'clone_url', 'ssh_url',
+        'homepage', 'archived', 'disabled', 'private'
+    )
+    
+    name: Optional[str]
+    full_name: Optional[str]
+    description: Optional[str]
+    language: Optional[str]
+    stars: int
+    forks: int
+    watchers: int
+    issues: int
+    created_at: Optional[str]
+    updated_at: Optional[str]
+    size: int
+    default_branch: Optional[str]
+    topics: List[str]
+    license: Optional[str]
+    clone_url: Optional[str]
+    ssh_url: Optional[str]
+    homepage: Optional[str]
+    archived: bool
+    disabled: bool
+    private: bool
+
+
+@dataclass
+class FileEntry:
+    """Archivo o directorio del repositorio"""
+    __slots__ = ('name', 'path', 'type', 'size', 'download_url', 'url')
+    
+    name: Optional[str]
+    path: Optional[str]
+    type: Optional[str]
+    size: int
+    download_url: Optional[str]
+    url: Optional[str]
+
+
+@dataclass
+class Commit:
+    """Commit del repositorio"""
+    __slots__ = ('sha', 'message', 'author', 'author_email', 'date', 'url')
+    
+    sha: Optional[str]
+    message: Optional[str]
+    author: Optional[str]
+    author_email: Optional[str]
+    date: Optional[str]
+    url: Optional[str]
+
+
+@dataclass
+class Issue:
+    """Issue del repositorio"""
+    __slots__ = (
+        'number', 'title', 'body', 'state', 'author',
+        'created_at', 'updated_at', 'labels', 'url'
+    )
+    
+    number: Optional[int]
+    title: Optional[str]
+    body: Optional[str]
+    state: Optional[str]
+    author: Optional[str]
+    created_at: Optional[str]
+    updated_at: Optional[str]
+    labels: List[str]
+    url: Optional[str]
+
+
+# Patrón para GitHub/GitLab: esquema://host/owner/repo[.git][/resto][?query][#fragmento]
+_URL_RE = re.compile(
+    r'^(https?)://([^/?#]+)/([^/?#]+)/([^/?#]+?)(?:\.git)?(?:[/?#].*)?$',
+    re.IGNORECASE
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_repo_url(repo_url: str) -> RepoRef:
+    """Extrae información de la URL del repositorio (memoizado por URL)"""
+    match = _URL_RE.match(repo_url)
+    
+    if not match:
+        raise ValueError("URL de repositorio inválida")
+    
+    scheme, host, owner, repo = match.groups()
+    platform = host.lower()
+    
+    if 'github.com' in platform:
+        provider = 'github.com'
+    elif 'gitlab.com' in platform:
+        provider = 'gitlab.com'
+    else:
+        provider = platform
+    
+    return RepoRef(
+        platform=platform,
+        provider=provider,
+        owner=owner,
+        repo=repo,
+        base_url=f"{scheme.lower()}://{host}"
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _get_api_url(platform: str, owner: str, repo: str) -> str:
+    """Genera la URL de la API según la plataforma (memoizado)"""
+    if 'github.com' in platform:
+        return f"https://api.github.com/repos/{owner}/{repo}"
+    elif 'gitlab.com' in platform:
+        return f"https://gitlab.com/api/v4/projects/{owner}%2F{repo}"
+    else:
+        raise ValueError(f"Plataforma no soportada: {platform}")
+
+
+# Extractores precompilados para los campos que siempre están presentes
+_GH_COMMIT_GET = operator.itemgetter('sha', 'html_url')
+_GL_COMMIT_GET = operator.itemgetter(
+    'id', 'message', 'author_name', 'author_email', 'created_at', 'web_url'
+)
+
+
+# Columnas de los resultados tabulares; las filas siguen el orden de los campos
+_COMMIT_FIELDS = Commit.__slots__
+_ISSUE_FIELDS = Issue.__slots__
+
+# Esquemas fijos: sin ellos pyarrow infiere 'null' en columnas vacías o sin
+# valores y las tablas de distintas páginas no se pueden concatenar
+if pa is not None:
+    _COMMIT_SCHEMA = pa.schema([(name, pa.string()) for name in _COMMIT_FIELDS])
+    _ISSUE_SCHEMA = pa.schema([
+        (name, pa.int64() if name == 'number' else pa.list_(pa.string()) if name == 'labels' else pa.string())
+        for name in _ISSUE_FIELDS
+    ])
+else:
+    _COMMIT_SCHEMA = _ISSUE_SCHEMA = None
+
+
+def _rows_to_table(rows: Iterable[Tuple[Any, ...]], schema: Optional['pa.Schema']) -> 'pa.Table':
+    """Vuelca filas directamente en las columnas de una tabla de pyarrow"""
+    if pa is None:
+        raise ImportError("as_table=True requiere pyarrow (pip install pyarrow)")
+    
+    fields = schema.names
+    columns: List[List[Any]] = [[] for _ in fields]
+    appenders = [column.append for column in columns]
+    
+    for row in rows:
+        for append, value in zip(appenders, row):
+            append(value)
+    
+    return pa.table(dict(zip(fields, columns)), schema=schema)
+
+
+# Pares "clave": escalar de JSON, para leer los campos fuera de los elementos en streaming
+_SCALAR_RE = re.compile(
+    rb'"([^"\\]+)"\s*:\s*(true|false|null|-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?|"(?:[^"\\]|\\.)*")'
+)
+
+
+class _AsyncByteReader:
+    """
+    Adapta el cuerpo en streaming de httpx a la interfaz read() asíncrona de ijson.
+    Conserva el principio y el final del cuerpo, donde quedan los campos de
+    primer nivel que rodean a la lista de elementos (p. ej. 'truncated').
+    """
+    
+    EDGE_SIZE = 512
+    
+    def __init__(self, response: httpx.Response):
+        self._chunks = response.aiter_bytes()
+        self._pending = b''
+        self.head = b''
+        self.tail = b''
+    
+    async def read(self, size: int = -1) -> bytes:
+        # ijson llama a read(0) para detectar si el flujo es de bytes o de texto
+        if size == 0:
+            return b''
+        
+        if self._pending:
+            chunk, self._pending = self._pending, b''
+            return chunk
+        
+        async for chunk in self._chunks:
+            if chunk:
+                if len(self.head) < self.EDGE_SIZE:
+                    self.head += chunk[:self.EDGE_SIZE - len(self.head)]
+                if len(chunk) >= self.EDGE_SIZE:
+                    self.tail = chunk[-self.EDGE_SIZE:]
+                else:
+                    self.tail = (self.tail + chunk)[-self.EDGE_SIZE:]
+                return chunk
+        return b''
+    
+    async def peek(self) -> bytes:
+        """Devuelve el primer carácter no blanco del cuerpo sin consumirlo"""
+        data = b''
+        while not data.strip():
+            chunk = await self.read()
+            if not chunk:
+                break
+            data += chunk
+        self._pending = data
+        return data.lstrip()[:1]
+    
+    async def read_all(self) -> bytes:
+        """Lee lo que queda del cuerpo"""
+        parts = []
+        while True:
+            chunk = await self.read()
+            if not chunk:
+                return b''.join(parts)
+            parts.append(chunk)
+    
+    def edge_scalars(self) -> Dict[str, Any]:
+        """Escalares de primer nivel antes de la primera lista y tras la última"""
+        start = self.head.find(b'[')
+        before = self.head if start < 0 else self.head[:start]
+        after = self.tail[self.tail.rfind(b']') + 1:]
+        return {
+            key.decode(): orjson.loads(value)
+            for key, value in _SCALAR_RE.findall(before + b',' + after)
+        }
+
 
 class RepositoryScraper:
     """
     Servicio para hacer scraping de repositorios Git (GitHub, GitLab, etc.)
     """
     
-    def __init__(self, token: Optional[str] = None):
-        self.session = requests.Session()
+    # Máximo de peticiones simultáneas al recorrer el árbol de archivos
+    MAX_CONCURRENT_REQUESTS = 16
+    
+    # Reintentos tras el primer intento y espera base del backoff exponencial
+    MAX_RETRIES = 3
+    RETRY_BACKOFF = 1
+    
+    # Códigos de estado transitorios que merecen reintento
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    
+    # Errores de red que el transporte no reintenta (él solo reintenta
+    # ConnectError/ConnectTimeout); el resto se propaga sin reintentar dos veces
+    RETRY_TRANSPORT_ERRORS = (
+        httpx.ReadTimeout,
+        httpx.WriteTimeout,
+        httpx.PoolTimeout,
+        httpx.ReadError,
+        httpx.WriteError,
+        httpx.RemoteProtocolError
+    )
+    
+    # Espera máxima ante un rate limit antes de volver a intentarlo
+    MAX_RATE_LIMIT_WAIT = 60
+    
+    # Cuerpos a partir de este tamaño se decodifican en un hilo aparte
+    THREAD_DECODE_THRESHOLD = 1024 * 1024
+    
+    GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+    
+    # Consulta única con la información básica, commits e issues de GitHub
+    GITHUB_FULL_QUERY = """
+    query($owner: String!, $repo: String!, $commits: Int!, $open: Int!, $closed: Int!) {
+      repository(owner: $owner, name: $repo) {
+        name
+        nameWithOwner
+        description
+        primaryLanguage { name }
+        stargazerCount
+        forkCount
+        openIssueCount: issues(states: OPEN) { totalCount }
+        openPullRequestCount: pullRequests(states: OPEN) { totalCount }
+        createdAt
+        updatedAt
+        diskUsage
+        defaultBranchRef {
+          name
+          target {
+            ... on Commit {
+              history(first: $commits) {
+                nodes { oid message url author { name email date } }
+              }
+            }
+          }
+        }
+        repositoryTopics(first: 20) { nodes { topic { name } } }
+        licenseInfo { name }
+        url
+        sshUrl
+        homepageUrl
+        isArchived
+        isDisabled
+        isPrivate
+        openIssues: issues(states: OPEN, first: $open, orderBy: {field: CREATED_AT, direction: DESC}) {
+          nodes { ...issueFields }
+        }
+        closedIssues: issues(states: CLOSED, first: $closed, orderBy: {field: CREATED_AT, direction: DESC}) {
+          nodes { ...issueFields }
+        }
+        openPullRequests: pullRequests(states: OPEN, first: $open, orderBy: {field: CREATED_AT, direction: DESC}) {
+          nodes { ...pullRequestFields }
+        }
+        closedPullRequests: pullRequests(states: [CLOSED, MERGED], first: $closed, orderBy: {field: CREATED_AT, direction: DESC}) {
+          nodes { ...pullRequestFields }
+        }
+      }
+    }
+    fragment issueFields on Issue {
+      number title body state createdAt updatedAt url
+      author { login }
+      labels(first: 20) { nodes { name } }
+    }
+    fragment pullRequestFields on PullRequest {
+      number title body state createdAt updatedAt url
+      author { login }
+      labels(first: 20) { nodes { name } }
+    }
+    """
+    
+    # Caché HTTP en disco; /tmp es el único directorio escribible en Lambda.
+    # Un directorio por usuario para no compartir respuestas autenticadas
+    DEFAULT_CACHE_DIR = os.path.join(
+        tempfile.gettempdir(),
+        f"repository-scraper-{os.getuid()}" if hasattr(os, 'getuid') else 'repository-scraper'
+    )
+    
+    def __init__(self, token: Optional[str] = None, cache_dir: Optional[str] = DEFAULT_CACHE_DIR):
+        self._client: Optional[httpx.AsyncClient] = None
+        self.cache_dir = cache_dir
+        # Epoch en el que se renueva la cuota si se ha agotado, 0 si queda cuota
+        self._rate_limit_reset = 0.0
         self.token = token
         self.base_headers = {
             'User-Agent': 'Repository-Scraper/1.0',
@@ -24,9 +394,88 @@ class RepositoryScraper:
         if token:
             self.base_headers['Authorization'] = f'token {token}'
         
-        self.session.headers.update(self.base_headers)
         self.logger = self._setup_logger()
         
+        # Parsers por plataforma: se eligen una vez por petición, no por elemento
+        self._repo_parsers = {
+            'github.com': self._parse_github_repo,
+            'gitlab.com': self._parse_gitlab_repo
+        }
+        # Commits e issues se extraen como filas para poder volcarlas en una
+        # tabla sin crear antes los objetos
+        self._commit_rows = {
+            'github.com': self._github_commit_row,
+            'gitlab.com': self._gitlab_commit_row
+        }
+        self._file_parsers = {
+            'github.com': self._parse_github_file,
+            'gitlab.com': self._parse_gitlab_file
+        }
+        self._issue_rows = {
+            'github.com': self._github_issue_row,
+            'gitlab.com': self._gitlab_issue_row
+        }
+        
+    def _prepare_cache_dir(self) -> bool:
+        """
+        Crea el directorio de caché solo accesible por el usuario actual.
+        Si ya existe y es de otro usuario o lo pueden leer otros, se desactiva
+        la caché: contiene respuestas autenticadas y podría estar manipulada.
+        """
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            info = os.lstat(self.cache_dir)
+        except OSError as e:
+            self.logger.warning(f"Caché HTTP desactivada, no se pudo crear {self.cache_dir}: {e}")
+            return False
+        
+        owned = not hasattr(os, 'getuid') or info.st_uid == os.getuid()
+        if not stat.S_ISDIR(info.st_mode) or not owned or info.st_mode & 0o077:
+            self.logger.warning(f"Caché HTTP desactivada, {self.cache_dir} no es un directorio privado del usuario actual")
+            return False
+        return True
+    
+    async def __aenter__(self) -> 'RepositoryScraper':
+        """
+        Abre el cliente HTTP/2 compartido por todas las peticiones.
+        Las peticiones concurrentes se multiplexan sobre una sola conexión TLS.
+        """
+        if self._client is None or self._client.is_closed:
+            # El transporte reintenta ConnectError/ConnectTimeout; el bucle de
+            # reintentos solo se ocupa de RETRY_TRANSPORT_ERRORS y RETRY_STATUSES
+            transport = httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=3,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+            )
+            
+            if self.cache_dir and hishel is None:
+                self.logger.warning("Caché HTTP desactivada: requiere hishel[async]>=1.0 (pip install 'hishel[async]')")
+            elif self.cache_dir and self._prepare_cache_dir():
+                # Revalida con ETag/Last-Modified: los 304 no consumen cuota de la API
+                transport = AsyncCacheTransport(
+                    next_transport=transport,
+                    storage=hishel.AsyncSqliteStorage(
+                        database_path=os.path.join(self.cache_dir, 'http_cache.db')
+                    ),
+                    # Caché privada: GitHub marca como 'private' las respuestas autenticadas
+                    policy=hishel.SpecificationPolicy(cache_options=hishel.CacheOptions(shared=False))
+                )
+            
+            self._client = httpx.AsyncClient(
+                transport=transport,
+                headers=self.base_headers,
+                timeout=30.0,
+                follow_redirects=True
+            )
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Cierra el cliente HTTP"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
     def _setup_logger(self) -> logging.Logger:
         """Configura el logger para el servicio"""
         logger = logging.getLogger('RepositoryScraper')
@@ -42,268 +491,676 @@ class RepositoryScraper:
             
         return logger
     
-    def _parse_repo_url(self, repo_url: str) -> Dict[str, str]:
+    def _parse_repo_url(self, repo_url: str) -> RepoRef:
         """Extrae información de la URL del repositorio"""
-        parsed = urlparse(repo_url)
-        
-        # Patrón para GitHub/GitLab: /owner/repo
-        path_parts = parsed.path.strip('/').split('/')
-        
-        if len(path_parts) < 2:
-            raise ValueError("URL de repositorio inválida")
-        
-        return {
-            'platform': parsed.netloc.lower(),
-            'owner': path_parts[0],
-            'repo': path_parts[1].replace('.git', ''),
-            'base_url': f"{parsed.scheme}://{parsed.netloc}"
-        }
+        return _parse_repo_url(repo_url)
     
-    def _get_api_url(self, platform: str, owner: str, repo: str) -> str:
-        """Genera la URL de la API según la plataforma"""
-        if 'github.com' in platform:
-            return f"https://api.github.com/repos/{owner}/{repo}"
-        elif 'gitlab.com' in platform:
-            return f"https://gitlab.com/api/v4/projects/{owner}%2F{repo}"
-        else:
-            raise ValueError(f"Plataforma no soportada: {platform}")
+    def _get_api_url(self, repo_info: RepoRef) -> str:
+        """Genera la URL base de la API según la plataforma"""
+        return _get_api_url(repo_info.platform, repo_info.owner, repo_info.repo)
     
-    def scrape_repository_info(self, repo_url: str) -> Dict[str, Any]:
+    async def scrape_repository_info(self, repo_url: str) -> Optional[Repository]:
         """
         Extrae información básica del repositorio
         """
         try:
             repo_info = self._parse_repo_url(repo_url)
-            api_url = self._get_api_url(
-                repo_info['platform'], 
-                repo_info['owner'], 
-                repo_info['repo']
-            )
+        except ValueError as e:
+            self.logger.error(f"Error al obtener información del repositorio: {e}")
+            return None
+        
+        return await self._scrape_repository_info_ref(repo_info)
+    
+    async def _scrape_repository_info_ref(self, repo_info: RepoRef) -> Optional[Repository]:
+        """Extrae información básica de un repositorio ya parseado"""
+        try:
+            api_url = self._get_api_url(repo_info)
             
-            self.logger.info(f"Obteniendo información de: {repo_url}")
-            response = self._make_request(api_url)
+            self.logger.info(f"Obteniendo información de: {repo_info.base_url}/{repo_info.owner}/{repo_info.repo}")
+            response = await self._make_request(api_url)
             
-            if 'github.com' in repo_info['platform']:
-                return self._parse_github_repo(response)
-            elif 'gitlab.com' in repo_info['platform']:
-                return self._parse_gitlab_repo(response)
+            return self._repo_parsers[repo_info.provider](response)
             
         except Exception as e:
             self.logger.error(f"Error al obtener información del repositorio: {e}")
-            return {}
+            return None
     
-    def _parse_github_repo(self, data: Dict) -> Dict[str, Any]:
+    def _parse_github_repo(self, data: Dict) -> Repository:
         """Parsea la respuesta de la API de GitHub"""
-        return {
-            'name': data.get('name'),
-            'full_name': data.get('full_name'),
-            'description': data.get('description'),
-            'language': data.get('language'),
-            'stars': data.get('stargazers_count', 0),
-            'forks': data.get('forks_count', 0),
-            'watchers': data.get('watchers_count', 0),
-            'issues': data.get('open_issues_count', 0),
-            'created_at': data.get('created_at'),
-            'updated_at': data.get('updated_at'),
-            'size': data.get('size', 0),
-            'default_branch': data.get('default_branch'),
-            'topics': data.get('topics', []),
-            'license': data.get('license', {}).get('name') if data.get('license') else None,
-            'clone_url': data.get('clone_url'),
-            'ssh_url': data.get('ssh_url'),
-            'homepage': data.get('homepage'),
-            'archived': data.get('archived', False),
-            'disabled': data.get('disabled', False),
-            'private': data.get('private', False)
-        }
+        return Repository(
+            name=data.get('name'),
+            full_name=data.get('full_name'),
+            description=data.get('description'),
+            language=data.get('language'),
+            stars=data.get('stargazers_count', 0),
+            forks=data.get('forks_count', 0),
+            watchers=data.get('watchers_count', 0),
+            issues=data.get('open_issues_count', 0),
+            created_at=data.get('created_at'),
+            updated_at=data.get('updated_at'),
+            size=data.get('size', 0),
+            default_branch=data.get('default_branch'),
+            topics=data.get('topics', []),
+            license=data.get('license', {}).get('name') if data.get('license') else None,
+            clone_url=data.get('clone_url'),
+            ssh_url=data.get('ssh_url'),
+            homepage=data.get('homepage'),
+            archived=data.get('archived', False),
+            disabled=data.get('disabled', False),
+            private=data.get('private', False)
+        )
     
-    def _parse_gitlab_repo(self, data: Dict) -> Dict[str, Any]:
+    def _parse_gitlab_repo(self, data: Dict) -> Repository:
         """Parsea la respuesta de la API de GitLab"""
-        return {
-            'name': data.get('name'),
-            'full_name': data.get('path_with_namespace'),
-            'description': data.get('description'),
-            'language': None,  # GitLab no proporciona esto directamente
-            'stars': data.get('star_count', 0),
-            'forks': data.get('forks_count', 0),
-            'watchers': 0,  # GitLab no tiene watchers
-            'issues': data.get('open_issues_count', 0),
-            'created_at': data.get('created_at'),
-            'updated_at': data.get('last_activity_at'),
-            'size': 0,  # No disponible en GitLab API v4
-            'default_branch': data.get('default_branch'),
-            'topics': data.get('topics', []),
-            'license': None,  # Requiere llamada adicional
-            'clone_url': data.get('http_url_to_repo'),
-            'ssh_url': data.get('ssh_url_to_repo'),
-            'homepage': data.get('web_url'),
-            'archived': data.get('archived', False),
-            'disabled': False,
-            'private': data.get('visibility') == 'private'
-        }
+        return Repository(
+            name=data.get('name'),
+            full_name=data.get('path_with_namespace'),
+            description=data.get('description'),
+            language=None,  # GitLab no proporciona esto directamente
+            stars=data.get('star_count', 0),
+            forks=data.get('forks_count', 0),
+            watchers=0,  # GitLab no tiene watchers
+            issues=data.get('open_issues_count', 0),
+            created_at=data.get('created_at'),
+            updated_at=data.get('last_activity_at'),
+            size=0,  # No disponible en GitLab API v4
+            default_branch=data.get('default_branch'),
+            topics=data.get('topics', []),
+            license=None,  # Requiere llamada adicional
+            clone_url=data.get('http_url_to_repo'),
+            ssh_url=data.get('ssh_url_to_repo'),
+            homepage=data.get('web_url'),
+            archived=data.get('archived', False),
+            disabled=False,
+            private=data.get('visibility') == 'private'
+        )
     
-    def scrape_file_structure(self, repo_url: str, path: str = "") -> List[Dict[str, Any]]:
+    async def scrape_file_structure(self, repo_url: str, path: str = "",
+                                    recursive: bool = False) -> List[FileEntry]:
         """
-        Extrae la estructura de archivos del repositorio
+        Extrae la estructura de archivos del repositorio.
+        Con recursive=True recorre también todos los subdirectorios.
         """
         try:
             repo_info = self._parse_repo_url(repo_url)
+        except ValueError as e:
+            self.logger.error(f"Error al obtener estructura de archivos: {e}")
+            return []
+        
+        return await self._scrape_file_structure_ref(repo_info, path, recursive)
+    
+    async def _scrape_file_structure_ref(self, repo_info: RepoRef, path: str = "",
+                                         recursive: bool = False) -> List[FileEntry]:
+        """Extrae la estructura de archivos de un repositorio ya parseado"""
+        try:
+            if recursive and not path and repo_info.provider == 'github.com':
+                # GitHub devuelve el árbol completo en una sola petición
+                tree = await self._github_full_tree(repo_info)
+                if tree is not None:
+                    return tree
             
-            if 'github.com' in repo_info['platform']:
-                api_url = f"https://api.github.com/repos/{repo_info['owner']}/{repo_info['repo']}/contents/{path}"
-            elif 'gitlab.com' in repo_info['platform']:
-                api_url = f"https://gitlab.com/api/v4/projects/{repo_info['owner']}%2F{repo_info['repo']}/repository/tree"
-                if path:
-                    api_url += f"?path={path}"
-            
-            response = self._make_request(api_url)
+            if recursive:
+                sem = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+                return await self._walk(repo_info, path, sem)
             
-            if isinstance(response, list):
-                return [self._parse_file_info(item, repo_info['platform']) for item in response]
-            else:
-                return [self._parse_file_info(response, repo_info['platform'])]
+            return await self._fetch_contents(repo_info, path)
                 
         except Exception as e:
             self.logger.error(f"Error al obtener estructura de archivos: {e}")
             return []
     
-    def _parse_file_info(self, item: Dict, platform: str) -> Dict[str, Any]:
-        """Parsea información de archivos/directorios"""
-        if 'github.com' in platform:
-            return {
-                'name': item.get('name'),
-                'path': item.get('path'),
-                'type': item.get('type'),  # file, dir
-                'size': item.get('size', 0),
-                'download_url': item.get('download_url'),
-                'url': item.get('url')
-            }
-        else:  # GitLab
-            return {
-                'name': item.get('name'),
-                'path': item.get('path'),
-                'type': item.get('type'),  # blob, tree
-                'size': 0,  # No disponible
-                'download_url': None,
-                'url': item.get('web_url')
-            }
+    async def _fetch_contents(self, repo_info: RepoRef, path: str = "") -> List[FileEntry]:
+        """Obtiene el contenido de un único directorio"""
+        api_url = self._get_api_url(repo_info)
+        
+        if repo_info.provider == 'github.com':
+            api_url += f"/contents/{path}"
+        else:
+            api_url += "/repository/tree"
+            if path:
+                api_url += f"?path={path}"
+        
+        return await self._iter_files(api_url, self._file_parsers[repo_info.provider])
+    
+    async def _iter_files(self, api_url: str, parser: Callable[[Dict], FileEntry]) -> List[FileEntry]:
+        """
+        Descarga un listado de archivos y parsea cada entrada según llega,
+        sin mantener a la vez la lista JSON original y la parseada
+        """
+        meta: Dict[str, Any] = {}
+        files = [parser(item) async for item in self._stream_items(api_url, 'item', meta=meta)]
+        
+        # Si la ruta es un archivo la API devuelve un objeto en lugar de una lista
+        if not files and meta:
+            files.append(parser(meta))
+        
+        return files
+    
+    async def _github_full_tree(self, repo_info: RepoRef,
+                                ref: str = "HEAD") -> Optional[List[FileEntry]]:
+        """
+        Obtiene el árbol completo de GitHub con git/trees?recursive=1.
+        Devuelve None si la respuesta viene truncada (repositorios enormes).
+        """
+        api_url = f"{self._get_api_url(repo_info)}/git/trees/{ref}"
+        meta: Dict[str, Any] = {}
+        
+        # Cada entrada se parsea según llega, sin mantener el JSON completo en memoria
+        tree = [
+            self._parse_github_tree_entry(entry)
+            async for entry in self._stream_items(api_url, 'tree.item', params={'recursive': 1}, meta=meta)
+        ]
+        
+        if meta.get('truncated'):
+            self.logger.warning("Árbol truncado por GitHub, recorriendo directorio a directorio")
+            return None
+        
+        return tree
     
-    def scrape_commits(self, repo_url: str, limit: int = 30) -> List[Dict[str, Any]]:
+    async def _walk(self, repo_info: RepoRef, path: str,
+                    sem: asyncio.Semaphore) -> List[FileEntry]:
         """
-        Extrae información de commits recientes
+        Recorre un directorio y sus subdirectorios en paralelo.
+        El semáforo solo se retiene durante la petición para que los
+        niveles superiores no bloqueen a los inferiores.
+        Si falla un subdirectorio se cancela el resto y se propaga el error:
+        un árbol incompleto no se distinguiría de uno completo.
+        """
+        async with sem:
+            items = await self._fetch_contents(repo_info, path)
+        
+        tasks = [
+            asyncio.ensure_future(self._walk(repo_info, item.path, sem))
+            for item in items if item.type in ('dir', 'tree')
+        ]
+        
+        try:
+            nested = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        
+        for sub in nested:
+            items.extend(sub)
+        
+        return items
+    
+    def _parse_github_file(self, item: Dict) -> FileEntry:
+        """Parsea información de archivos/directorios de GitHub"""
+        return FileEntry(
+            name=item.get('name'),
+            path=item.get('path'),
+            type=item.get('type'),  # file, dir
+            size=item.get('size', 0),
+            download_url=item.get('download_url'),
+            url=item.get('url')
+        )
+    
+    def _parse_github_tree_entry(self, entry: Dict) -> FileEntry:
+        """Adapta una entrada de git/trees al formato de la API de contenidos"""
+        entry_type = entry.get('type')
+        
+        if entry_type == 'tree':
+            entry_type = 'dir'
+        elif entry_type == 'commit':
+            entry_type = 'submodule'
+        elif entry.get('mode') == '120000':
+            entry_type = 'symlink'
+        else:
+            entry_type = 'file'
+        
+        path = entry.get('path', '')
+        
+        return FileEntry(
+            name=path.rsplit('/', 1)[-1],
+            path=path,
+            type=entry_type,
+            size=entry.get('size', 0),
+            download_url=None,  # git/trees no incluye la URL de descarga
+            url=entry.get('url')
+        )
+    
+    def _parse_gitlab_file(self, item: Dict) -> FileEntry:
+        """Parsea información de archivos/directorios de GitLab"""
+        return FileEntry(
+            name=item.get('name'),
+            path=item.get('path'),
+            type=item.get('type'),  # blob, tree
+            size=0,  # No disponible
+            download_url=None,
+            url=item.get('web_url')
+        )
+    
+    async def scrape_commits(self, repo_url: str, limit: int = 30,
+                             as_table: bool = False) -> Union[List[Commit], 'pa.Table']:
+        """
+        Extrae información de commits recientes.
+        Con as_table=True devuelve una pyarrow.Table (una columna por campo).
         """
         try:
             repo_info = self._parse_repo_url(repo_url)
+        except ValueError as e:
+            self.logger.error(f"Error al obtener commits: {e}")
+            return _rows_to_table([], _COMMIT_SCHEMA) if as_table else []
+        
+        return await self._scrape_commits_ref(repo_info, limit, as_table)
+    
+    async def _scrape_commits_ref(self, repo_info: RepoRef, limit: int = 30,
+                                  as_table: bool = False) -> Union[List[Commit], 'pa.Table']:
+        """Extrae los commits recientes de un repositorio ya parseado"""
+        try:
+            api_url = self._get_api_url(repo_info)
             
-            if 'github.com' in repo_info['platform']:
-                api_url = f"https://api.github.com/repos/{repo_info['owner']}/{repo_info['repo']}/commits"
-            elif 'gitlab.com' in repo_info['platform']:
-                api_url = f"https://gitlab.com/api/v4/projects/{repo_info['owner']}%2F{repo_info['repo']}/repository/commits"
+            if repo_info.provider == 'github.com':
+                api_url += "/commits"
+            else:
+                api_url += "/repository/commits"
             
             params = {'per_page': limit}
-            response = self._make_request(api_url, params=params)
+            response = await self._make_request(api_url, params=params)
             
-            return [self._parse_commit_info(commit, repo_info['platform']) for commit in response]
+            row = self._commit_rows[repo_info.provider]
+            rows = map(row, response)
+            
+            if as_table:
+                return _rows_to_table(rows, _COMMIT_SCHEMA)
+            return [Commit(*values) for values in rows]
             
         except Exception as e:
             self.logger.error(f"Error al obtener commits: {e}")
-            return []
+            return _rows_to_table([], _COMMIT_SCHEMA) if as_table else []
     
-    def _parse_commit_info(self, commit: Dict, platform: str) -> Dict[str, Any]:
-        """Parsea información de commits"""
-        if 'github.com' in platform:
-            return {
-                'sha': commit.get('sha'),
-                'message': commit.get('commit', {}).get('message'),
-                'author': commit.get('commit', {}).get('author', {}).get('name'),
-                'author_email': commit.get('commit', {}).get('author', {}).get('email'),
-                'date': commit.get('commit', {}).get('author', {}).get('date'),
-                'url': commit.get('html_url')
-            }
-        else:  # GitLab
-            return {
-                'sha': commit.get('id'),
-                'message': commit.get('message'),
-                'author': commit.get('author_name'),
-                'author_email': commit.get('author_email'),
-                'date': commit.get('created_at'),
-                'url': commit.get('web_url')
-            }
+    def _github_commit_row(self, commit: Dict) -> Tuple[Any, ...]:
+        """Extrae un commit de GitHub como fila en el orden de _COMMIT_FIELDS"""
+        sha, url = _GH_COMMIT_GET(commit)
+        info = commit.get('commit') or {}
+        author = info.get('author') or {}
+        
+        return (
+            sha,
+            info.get('message'),
+            author.get('name'),
+            author.get('email'),
+            author.get('date'),
+            url
+        )
+    
+    def _gitlab_commit_row(self, commit: Dict) -> Tuple[Any, ...]:
+        """Extrae un commit de GitLab como fila en el orden de _COMMIT_FIELDS"""
+        # Los campos del itemgetter ya están en el orden de las columnas
+        return _GL_COMMIT_GET(commit)
     
-    def scrape_issues(self, repo_url: str, state: str = "open", limit: int = 30) -> List[Dict[str, Any]]:
+    async def scrape_issues(self, repo_url: str, state: str = "open", limit: int = 30,
+                            as_table: bool = False) -> Union[List[Issue], 'pa.Table']:
         """
-        Extrae información de issues
+        Extrae información de issues.
+        Con as_table=True devuelve una pyarrow.Table (una columna por campo).
         """
         try:
             repo_info = self._parse_repo_url(repo_url)
-            
-            if 'github.com' in repo_info['platform']:
-                api_url = f"https://api.github.com/repos/{repo_info['owner']}/{repo_info['repo']}/issues"
-            elif 'gitlab.com' in repo_info['platform']:
-                api_url = f"https://gitlab.com/api/v4/projects/{repo_info['owner']}%2F{repo_info['repo']}/issues"
+        except ValueError as e:
+            self.logger.error(f"Error al obtener issues: {e}")
+            return _rows_to_table([], _ISSUE_SCHEMA) if as_table else []
+        
+        return await self._scrape_issues_ref(repo_info, state, limit, as_table)
+    
+    async def _scrape_issues_ref(self, repo_info: RepoRef, state: str = "open", limit: int = 30,
+                                 as_table: bool = False) -> Union[List[Issue], 'pa.Table']:
+        """Extrae los issues de un repositorio ya parseado"""
+        try:
+            api_url = self._get_api_url(repo_info) + "/issues"
             
             params = {'state': state, 'per_page': limit}
-            response = self._make_request(api_url, params=params)
+            response = await self._make_request(api_url, params=params)
+            
+            row = self._issue_rows[repo_info.provider]
+            rows = map(row, response)
             
-            return [self._parse_issue_info(issue, repo_info['platform']) for issue in response]
+            if as_table:
+                return _rows_to_table(rows, _ISSUE_SCHEMA)
+            return [Issue(*values) for values in rows]
             
         except Exception as e:
             self.logger.error(f"Error al obtener issues: {e}")
-            return []
+            return _rows_to_table([], _ISSUE_SCHEMA) if as_table else []
     
-    def _parse_issue_info(self, issue: Dict, platform: str) -> Dict[str, Any]:
-        """Parsea información de issues"""
-        if 'github.com' in platform:
-            return {
-                'number': issue.get('number'),
-                'title': issue.get('title'),
-                'body': issue.get('body'),
-                'state': issue.get('state'),
-                'author': issue.get('user', {}).get('login'),
-                'created_at': issue.get('created_at'),
-                'updated_at': issue.get('updated_at'),
-                'labels': [label.get('name') for label in issue.get('labels', [])],
-                'url': issue.get('html_url')
-            }
-        else:  # GitLab
-            return {
-                'number': issue.get('iid'),
-                'title': issue.get('title'),
-                'body': issue.get('description'),
-                'state': issue.get('state'),
-                'author': issue.get('author', {}).get('username'),
-                'created_at': issue.get('created_at'),
-                'updated_at': issue.get('updated_at'),
-                'labels': issue.get('labels', []),
-                'url': issue.get('web_url')
-            }
+    def _github_issue_row(self, issue: Dict) -> Tuple[Any, ...]:
+        """Extrae un issue de GitHub como fila en el orden de _ISSUE_FIELDS"""
+        return (
+            issue.get('number'),
+            issue.get('title'),
+            issue.get('body'),
+            issue.get('state'),
+            issue.get('user', {}).get('login'),
+            issue.get('created_at'),
+            issue.get('updated_at'),
+            [label.get('name') for label in issue.get('labels', [])],
+            issue.get('html_url')
+        )
+    
+    def _gitlab_issue_row(self, issue: Dict) -> Tuple[Any, ...]:
+        """Extrae un issue de GitLab como fila en el orden de _ISSUE_FIELDS"""
+        return (
+            issue.get('iid'),
+            issue.get('title'),
+            issue.get('description'),
+            issue.get('state'),
+            issue.get('author', {}).get('username'),
+            issue.get('created_at'),
+            issue.get('updated_at'),
+            issue.get('labels', []),
+            issue.get('web_url')
+        )
+    
+    async def _make_request(self, url: str, params: Optional[Dict] = None,
+                            payload: Optional[Dict] = None) -> Dict[str, Any]:
+        """
+        Realiza petición HTTP con manejo de errores y rate limiting.
+        Si se indica payload se envía como POST con cuerpo JSON.
+        """
+        response = await self._send(url, params=params, payload=payload)
+        body = response.content
+        
+        # En respuestas grandes el bucle de eventos sigue atendiendo otras peticiones
+        if len(body) >= self.THREAD_DECODE_THRESHOLD:
+            return await asyncio.to_thread(orjson.loads, body)
+        
+        return orjson.loads(body)
+    
+    async def _stream_items(self, url: str, prefix: str, params: Optional[Dict] = None,
+                            meta: Optional[Dict[str, Any]] = None):
+        """
+        Descarga una respuesta JSON en streaming y va devolviendo los elementos
+        bajo 'prefix' según llegan, sin cargar el cuerpo completo en memoria.
+        Los valores escalares de primer nivel se guardan en 'meta' si se indica;
+        si se esperaba una lista ('item') y llega un objeto, se guarda entero.
+        """
+        response = await self._send(url, params=params, stream=True)
+        
+        try:
+            reader = _AsyncByteReader(response)
+            
+            # Un objeto suelto (p. ej. /contents de un archivo) es pequeño: se decodifica entero
+            if prefix == 'item' and await reader.peek() != b'[':
+                if meta is not None:
+                    meta.update(orjson.loads(await reader.read_all()))
+                return
+            
+            # ijson.items construye cada elemento en el backend C (yajl2_c)
+            async for item in ijson.items(reader, prefix, use_float=True):
+                yield item
+            
+            if meta is not None:
+                meta.update(reader.edge_scalars())
+        finally:
+            await response.aclose()
     
-    def _make_request(self, url: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Realiza petición HTTP con manejo de errores y rate limiting"""
-        max_retries = 3
-        retry_delay = 1
+    async def _send(self, url: str, params: Optional[Dict] = None,
+                    payload: Optional[Dict] = None, stream: bool = False) -> httpx.Response:
+        """
+        Envía la petición con reintentos y rate limiting y devuelve la respuesta.
+        Con stream=True el cuerpo queda sin leer y debe cerrarse con aclose().
+        """
+        if self._client is None:
+            raise RuntimeError("El cliente no está abierto; usa 'async with RepositoryScraper()'")
+        
+        # Solo las peticiones GET se reintentan ante errores 5xx o timeouts
+        idempotent = payload is None
         
-        for attempt in range(max_retries):
+        for attempt in range(self.MAX_RETRIES + 1):
+            last_attempt = attempt == self.MAX_RETRIES
+            
+            await self._wait_for_rate_limit()
+            
+            if payload is None:
+                request = self._client.build_request('GET', url, params=params)
+            else:
+                request = self._client.build_request(
+                    'POST',
+                    url,
+                    params=params,
+                    content=orjson.dumps(payload),
+                    headers={'Content-Type': 'application/json'}
+                )
+            
             try:
-                response = self.session.get(url, params=params, timeout=30)
+                response = await self._client.send(request, stream=stream)
+            except self.RETRY_TRANSPORT_ERRORS:
+                if last_attempt or not idempotent:
+                    raise
                 
-                if response.status_code == 403:
-                    self.logger.warning("Rate limit alcanzado, esperando...")
-                    time.sleep(60)
-                    continue
+                delay = self.RETRY_BACKOFF * 2 ** attempt
+                self.logger.warning(f"Intento {attempt + 1} falló, reintentando en {delay}s")
+                await asyncio.sleep(delay)
+                continue
+            
+            self._track_rate_limit(response)
+            rate_limit_delay = self._rate_limit_delay(response)
+            
+            if rate_limit_delay is not None:
+                await response.aclose()
+                if last_attempt or rate_limit_delay > self.MAX_RATE_LIMIT_WAIT:
+                    # Esperar no serviría: la cuota no se renueva a tiempo
+                    response.raise_for_status()
                 
+                # La espera se hace una sola vez, en _wait_for_rate_limit antes del siguiente envío
+                self._rate_limit_reset = max(self._rate_limit_reset, time.time() + rate_limit_delay)
+                self.logger.warning(f"Rate limit alcanzado, reintentando en {rate_limit_delay}s")
+                continue
+            
+            delay = self._retry_delay(response, attempt, idempotent)
+            
+            if delay is None:
+                if response.is_error:
+                    await response.aclose()
+                    # Los errores 4xx no se resuelven reintentando
+                    response.raise_for_status()
+                return response
+            
+            await response.aclose()
+            if last_attempt:
                 response.raise_for_status()
-                return response.json()
-                
-            except requests.exceptions.RequestException as e:
-                if attempt < max_retries - 1:
-                    self.logger.warning(f"Intento {attempt + 1} falló, reintentando en {retry_delay}s")
-                    time.sleep(retry_delay)
-                    retry_delay *= 2
-                else:
-                    raise e
+            
+            self.logger.warning(f"Intento {attempt + 1} falló ({response.status_code}), reintentando en {delay}s")
+            await asyncio.sleep(delay)
     
-    def scrape_full_repository(self, repo_url: str) -> Dict[str, Any]:
+    def _retry_delay(self, response: httpx.Response, attempt: int, idempotent: bool) -> Optional[float]:
+        """
+        Devuelve los segundos a esperar antes de reintentar, o None si la
+        respuesta no debe reintentarse. Los rate limits con cabeceras de cuota
+        los gestiona _send; aquí un 429 sin cabeceras usa backoff y los errores
+        5xx solo se reintentan en peticiones idempotentes.
+        """
+        status = response.status_code
+        
+        if status == 429:
+            return self.RETRY_BACKOFF * 2 ** attempt
+        
+        if status == 403:
+            # Un 403 sin cabeceras de cuota es un error de permisos
+            return None
+        
+        if idempotent and status in self.RETRY_STATUSES:
+            retry_after = self._retry_after(response)
+            if retry_after is not None:
+                return min(retry_after, self.MAX_RATE_LIMIT_WAIT)
+            return self.RETRY_BACKOFF * 2 ** attempt
+        
+        return None
+    
+    def _retry_after(self, response: httpx.Response) -> Optional[int]:
+        """Devuelve los segundos indicados en Retry-After, o None si no los hay"""
+        retry_after = response.headers.get('Retry-After')
+        
+        if retry_after and retry_after.isdigit():
+            return int(retry_after)
+        return None
+    
+    def _track_rate_limit(self, response: httpx.Response) -> None:
+        """Anota cuándo se renueva la cuota si la respuesta indica que se ha agotado"""
+        headers = response.headers
+        remaining = headers.get('X-RateLimit-Remaining', headers.get('RateLimit-Remaining'))
+        reset = headers.get('X-RateLimit-Reset', headers.get('RateLimit-Reset'))
+        
+        if remaining == '0' and reset:
+            self._rate_limit_reset = float(reset)
+        elif remaining is not None:
+            self._rate_limit_reset = 0.0
+    
+    async def _wait_for_rate_limit(self) -> None:
+        """
+        Espera a que se renueve la cuota antes de lanzar una petición que fallaría.
+        Si la renovación está más lejos que MAX_RATE_LIMIT_WAIT falla en el acto.
+        """
+        delay = self._rate_limit_reset - time.time()
+        
+        if delay > self.MAX_RATE_LIMIT_WAIT:
+            raise RuntimeError(f"Cuota de la API agotada durante {delay:.0f}s más")
+        
+        if delay > 0:
+            self.logger.warning(f"Cuota agotada, esperando {delay:.0f}s...")
+            await asyncio.sleep(delay)
+    
+    def _rate_limit_delay(self, response: httpx.Response) -> Optional[int]:
+        """
+        Devuelve los segundos a esperar según Retry-After o X-RateLimit-Reset
+        si la respuesta es un rate limit, o None si no trae cabeceras de cuota
+        """
+        if response.status_code not in (403, 429):
+            return None
+        
+        headers = response.headers
+        retry_after = self._retry_after(response)
+        remaining = headers.get('X-RateLimit-Remaining', headers.get('RateLimit-Remaining'))
+        reset = headers.get('X-RateLimit-Reset', headers.get('RateLimit-Reset'))
+        
+        if retry_after is not None:
+            delay = retry_after
+        elif remaining == '0' and reset:
+            delay = max(0, int(reset) - int(time.time()))
+        else:
+            return None
+        
+        return delay
+    
+    async def _scrape_rest_metadata(self, repo_info: RepoRef) -> Dict[str, Any]:
+        """Obtiene información básica, commits e issues con la API REST"""
+        basic_info, commits, open_issues, closed_issues = await asyncio.gather(
+            self._scrape_repository_info_ref(repo_info),
+            self._scrape_commits_ref(repo_info, limit=50),
+            self._scrape_issues_ref(repo_info, state="open", limit=50),
+            self._scrape_issues_ref(repo_info, state="closed", limit=20)
+        )
+        
+        return {
+            'basic_info': basic_info,
+            'recent_commits': commits,
+            'open_issues': open_issues,
+            'closed_issues': closed_issues
+        }
+    
+    async def _scrape_github_graphql(self, repo_info: RepoRef) -> Dict[str, Any]:
+        """
+        Obtiene información básica, commits e issues de GitHub en una sola
+        consulta GraphQL. Si la consulta falla se recurre a la API REST.
+        """
+        try:
+            limits = {'commits': 50, 'open': 50, 'closed': 20}
+            payload = {
+                'query': self.GITHUB_FULL_QUERY,
+                'variables': {
+                    'owner': repo_info.owner,
+                    'repo': repo_info.repo,
+                    **limits
+                }
+            }
+            
+            response = await self._make_request(self.GITHUB_GRAPHQL_URL, payload=payload)
+            
+            if response.get('errors'):
+                raise ValueError(response['errors'][0].get('message'))
+            
+            return self._parse_github_graphql(response['data']['repository'], limits)
+            
+        except Exception as e:
+            self.logger.warning(f"GraphQL no disponible, usando API REST: {e}")
+            return await self._scrape_rest_metadata(repo_info)
+    
+    def _parse_github_graphql(self, data: Dict, limits: Dict[str, int]) -> Dict[str, Any]:
+        """
+        Parsea la respuesta GraphQL de GitHub al mismo formato que la API REST.
+        Como /issues en REST, las listas y el contador de issues incluyen los
+        pull requests, mezclados por fecha de creación.
+        """
+        branch = data.get('defaultBranchRef') or {}
+        history = (branch.get('target') or {}).get('history') or {}
+        
+        basic_info = Repository(
+            name=data.get('name'),
+            full_name=data.get('nameWithOwner'),
+            description=data.get('description'),
+            language=(data.get('primaryLanguage') or {}).get('name'),
+            stars=data.get('stargazerCount', 0),
+            forks=data.get('forkCount', 0),
+            watchers=data.get('stargazerCount', 0),
+            issues=(data.get('openIssueCount', {}).get('totalCount', 0)
+                    + data.get('openPullRequestCount', {}).get('totalCount', 0)),
+            created_at=data.get('createdAt'),
+            updated_at=data.get('updatedAt'),
+            size=data.get('diskUsage') or 0,
+            default_branch=branch.get('name'),
+            topics=[node['topic']['name'] for node in data.get('repositoryTopics', {}).get('nodes', [])],
+            license=(data.get('licenseInfo') or {}).get('name'),
+            clone_url=f"{data.get('url')}.git",
+            ssh_url=data.get('sshUrl'),
+            homepage=data.get('homepageUrl'),
+            archived=data.get('isArchived', False),
+            disabled=data.get('isDisabled', False),
+            private=data.get('isPrivate', False)
+        )
+        
+        commits = [
+            Commit(
+                sha=node.get('oid'),
+                message=node.get('message'),
+                author=(node.get('author') or {}).get('name'),
+                author_email=(node.get('author') or {}).get('email'),
+                date=(node.get('author') or {}).get('date'),
+                url=node.get('url')
+            )
+            for node in history.get('nodes', [])
+        ]
+        
+        return {
+            'basic_info': basic_info,
+            'recent_commits': commits,
+            'open_issues': self._merge_github_graphql_issues(data, 'openIssues', 'openPullRequests', limits['open']),
+            'closed_issues': self._merge_github_graphql_issues(data, 'closedIssues', 'closedPullRequests', limits['closed'])
+        }
+    
+    def _merge_github_graphql_issues(self, data: Dict, issues_key: str, pulls_key: str, limit: int) -> List[Issue]:
+        """Une issues y pull requests ordenados por fecha de creación, como /issues en REST"""
+        nodes = data.get(issues_key, {}).get('nodes', []) + data.get(pulls_key, {}).get('nodes', [])
+        nodes.sort(key=lambda node: node.get('createdAt') or '', reverse=True)
+        return [self._parse_github_graphql_issue(node) for node in nodes[:limit]]
+    
+    def _parse_github_graphql_issue(self, issue: Dict) -> Issue:
+        """Parsea un issue de la respuesta GraphQL de GitHub"""
+        return Issue(
+            number=issue.get('number'),
+            title=issue.get('title'),
+            body=issue.get('body'),
+            # REST no distingue los pull requests fusionados de los cerrados
+            state='closed' if issue.get('state') == 'MERGED' else (issue.get('state') or '').lower(),
+            author=(issue.get('author') or {}).get('login'),
+            created_at=issue.get('createdAt'),
+            updated_at=issue.get('updatedAt'),
+            labels=[label.get('name') for label in issue.get('labels', {}).get('nodes', [])],
+            url=issue.get('url')
+        )
+    
+    async def scrape_full_repository(self, repo_url: str) -> Dict[str, Any]:
         """
         Realiza un scraping completo del repositorio
         """
@@ -312,55 +1169,69 @@ class RepositoryScraper:
         result = {
             'scraped_at': datetime.now().isoformat(),
             'repository_url': repo_url,
-            'basic_info': {},
+            'basic_info': None,
             'file_structure': [],
             'recent_commits': [],
             'open_issues': [],
             'closed_issues': []
         }
         
-        # Información básica
-        result['basic_info'] = self.scrape_repository_info(repo_url)
-        
-        # Estructura de archivos
-        result['file_structure'] = self.scrape_file_structure(repo_url)
-        
-        # Commits recientes
-        result['recent_commits'] = self.scrape_commits(repo_url, limit=50)
+        # La URL se parsea una sola vez para todas las peticiones
+        try:
+            repo_info = self._parse_repo_url(repo_url)
+        except ValueError as e:
+            self.logger.error(f"Error en el scraping completo: {e}")
+            return result
         
-        # Issues abiertas
-        result['open_issues'] = self.scrape_issues(repo_url, state="open", limit=50)
+        # GraphQL requiere autenticación; sin token se usa la API REST
+        if self.token and repo_info.provider == 'github.com':
+            metadata = self._scrape_github_graphql(repo_info)
+        else:
+            metadata = self._scrape_rest_metadata(repo_info)
         
-        # Issues cerradas
-        result['closed_issues'] = self.scrape_issues(repo_url, state="closed", limit=20)
+        # Metadatos y estructura de archivos en paralelo
+        metadata, result['file_structure'] = await asyncio.gather(
+            metadata,
+            self._scrape_file_structure_ref(repo_info, recursive=True)
+        )
+        result.update(metadata)
         
         self.logger.info("Scraping completo finalizado")
         return result
 
 
 # Ejemplo de uso
-if __name__ == "__main__":
+async def main():
     # Inicializar el scraper (opcionalmente con token de GitHub)
-    # scraper = RepositoryScraper(token="tu_github_token_aqui")
-    scraper = RepositoryScraper()
-    
-    # URL del repositorio a scrapear
-    repo_url = "https://github.com/microsoft/vscode"
-    
-    # Scraping completo
-    data = scraper.scrape_full_repository(repo_url)
-    
-    # También puedes usar métodos individuales
-    print("=== Información básica ===")
-    basic_info = scraper.scrape_repository_info(repo_url)
-    print(json.dumps(basic_info, indent=2))
-    
-    print("\n=== Estructura de archivos (raíz) ===")
-    files = scraper.scrape_file_structure(repo_url)
-    for file in files[:5]:  # Mostrar solo los primeros 5
-        print(f"- {file['name']} ({file['type']})")
-    
-    print("\n=== Commits recientes ===")
-    commits = scraper.scrape_commits(repo_url, limit=5)
-    for commit in commits:
-        print(f"- {commit['message'][:50]}... por {commit['author']}")
\ No newline at end of file
+    # async with RepositoryScraper(token="tu_github_token_aqui") as scraper:
+    async with RepositoryScraper() as scraper:
+        # URL del repositorio a scrapear
+        repo_url = "https://github.com/microsoft/vscode"
+        
+        # Scraping completo
+        data = await scraper.scrape_full_repository(repo_url)
+        
+        # También puedes usar métodos individuales
+        print("=== Información básica ===")
+        basic_info = await scraper.scrape_repository_info(repo_url)
+        print(orjson.dumps(basic_info, option=orjson.OPT_INDENT_2).decode())
+        
+        print("\n=== Estructura de archivos (raíz) ===")
+        files = await scraper.scrape_file_structure(repo_url)
+        for file in files[:5]:  # Mostrar solo los primeros 5
+            print(f"- {file.name} ({file.type})")
+        
+        print("\n=== Commits recientes ===")
+        commits = await scraper.scrape_commits(repo_url, limit=5)
+        for commit in commits:
+            print(f"- {commit.message[:50]}... por {commit.author}")
+
+
+if __name__ == "__main__":
+    # uvloop reduce la sobrecarga del bucle de eventos; no existe en Windows
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file